@@ -1,3 +1,6 @@
+#Imports
+from SPORK_Junction import _COMP_TABLE
+
 #BinPair class
 class BinPair(object):
     __slots__ = ["five_prime_SAM","three_prime_SAM","five_prime_bin","three_prime_bin",
@@ -73,15 +76,10 @@ class BinPair(object):
         self.three_prime_SAM.stop = hold_five_prime_stop
 
         #Take the reverse compliment of the 5' and 3' seqs
-        #The list comprehensions are complicated but I like doing it in one line:
-        #   The [rev_comp_dict[base] for base in self.five_prime_SAM.seq] builds a list of complimentary bases
-        #   The "".join takes that list and turns it into a string
+        #   The translate builds the complimentary bases in one pass over the bytes
         #   The [::-1] at the very end reverses the string to turn the compliment string into the rev comp string
-        rev_comp_dict = {"A":"T","a":"t","T":"A","t":"a",
-                         "C":"G","c":"g","G":"C","g":"c",
-                         "N":"N","n":"n"}
-        rev_comp_5_prime_seq = "".join([rev_comp_dict[base] for base in self.five_prime_SAM.seq])[::-1]
-        rev_comp_3_prime_seq = "".join([rev_comp_dict[base] for base in self.three_prime_SAM.seq])[::-1]
+        rev_comp_5_prime_seq = self.five_prime_SAM.seq.translate(_COMP_TABLE)[::-1]
+        rev_comp_3_prime_seq = self.three_prime_SAM.seq.translate(_COMP_TABLE)[::-1]
 
         #Then put the orig 3' rev comp into the new 5' and vice versa
         self.five_prime_SAM.seq = rev_comp_3_prime_seq
@@ -2,14 +2,55 @@
 
 #Imports
 from SPORK_SAMEntry import SAMEntry
+from operator import attrgetter
 import copy
+import string
 import sys
 
+#Complement lookup used by translate for the reverse compliments
+#(on python 2 string.maketrans gives a 256 byte table so translate works on the raw bytes)
+#Includes the IUPAC ambiguity codes so ambiguous bases are complemented too
+_COMP_FROM = "acgtrymkswhbvdnxACGTRYMKSWHBVDNX"
+_COMP_TO   = "tgcayrkmswdvbhnxTGCAYRKMSWDVBHNX"
+try:
+    _COMP_TABLE = str.maketrans(_COMP_FROM,_COMP_TO)
+except AttributeError:
+    _COMP_TABLE = string.maketrans(_COMP_FROM,_COMP_TO)
+
+#Run of N's that the consensus padding is sliced from (grown if a longer flank is asked for)
+_N_PAD = "N"*1000
+
+def _n_padding(length):
+    """
+    Goal: return a string of N's sliced from the shared _N_PAD
+    Arguments:
+        length is an int, the number of N's wanted
+
+    Returns:
+        a string of length N's (empty if length isn't positive, like "N"*length)
+    """
+    global _N_PAD
+    if length <= 0:
+        return ""
+    if length > len(_N_PAD):
+        _N_PAD = "N"*length
+    return _N_PAD[:length]
+
+#Sort key giving the same order as Junction.__lt__ without a python level compare
+#use as sorted(jcts,key=SORT_KEY) instead of sorted(jcts)
+SORT_KEY = attrgetter("bin_pair")
+
 #Junction class
+#NOTE the underscore slots cache results of the splice/boundary/fusion methods
+#so no instance needs a __dict__. Assign the consensus, sams and gtfs before
+#calling those methods, or call invalidate() after changing any of them
 class Junction(object):
-    __slots__ = ["consensus","score","bin_pair","bin_pair_group",
+    __slots__ = ("consensus","score","bin_pair","bin_pair_group",
                  "took_reverse_compliment","constants_dict","badfj3",
-                 "donor_sam","acceptor_sam","mapq","jct_ind"]
+                 "donor_sam","acceptor_sam","mapq","jct_ind",
+                 "_splice_ind","_splice_gap","_splice_type","_fusion_type","_padded",
+                 "_don_dist","_acc_dist","_five_bin","_three_bin",
+                 "_flank")
 
     def __init__(self,consensus,score,bin_pair_group,jct_ind,took_reverse_compliment,constants_dict):
         """
@@ -31,12 +72,15 @@ class Junction(object):
         self.jct_ind = jct_ind
         self.took_reverse_compliment = took_reverse_compliment
         self.constants_dict = constants_dict
+        self._flank = int(constants_dict["splice_flank_len"])
         self.mapq = 0
         self.badfj3 = False
 
         #Find chromosome, bin_pair and strand info from the first mapped read
         rep_bin_pair = self.bin_pair_group[0]
         self.bin_pair = rep_bin_pair.bin_pair
+        self._five_bin = rep_bin_pair.five_prime_bin
+        self._three_bin = rep_bin_pair.three_prime_bin
         self.donor_sam = SAMEntry()
         self.acceptor_sam = SAMEntry()
 
@@ -50,6 +94,45 @@ class Junction(object):
         self.acceptor_sam.start = rep_bin_pair.three_prime_SAM.start
         self.acceptor_sam.stop = rep_bin_pair.three_prime_SAM.stop
 
+        #Cached results of the splice/fusion methods (filled on first call)
+        self.invalidate()
+
+
+    #Clear the cached splice/fusion results
+    def invalidate(self):
+        """
+        Goal: forget the cached splice and fusion results of this junction
+              must be called whenever the consensus, sams or gtfs are reassigned
+        Arguments:
+            none
+
+        Returns:
+            nothing
+        """
+        self._splice_ind = None
+        self._splice_gap = None
+        self._splice_type = None
+        self._fusion_type = None
+        self._padded = None
+        self._don_dist = None
+        self._acc_dist = None
+
+
+    #Fill the sam based caches once the sams are assigned
+    def finalize(self):
+        """
+        Goal: reset the caches and compute the splice results in one pass
+              call after assigning the donor and acceptor sams (the gtf based
+              results are still computed on first use since gtfs come later)
+        Arguments:
+            none
+
+        Returns:
+            nothing
+        """
+        self.invalidate()
+        self.splice_ind()
+        self.splice_type()
 
 
     #Use the sam's to find the splice index in reference to the concensus
@@ -63,11 +146,13 @@ class Junction(object):
             the 3' edge of the donor sequence if both sams are defined
             otherwise returns the middle index of the consensus as a guess
         """
-        if self.donor_sam.exists and self.acceptor_sam.exists:
-            #NOTE currently doesn't handle gaps well (just returns the donor side index of gap)
-            return len(self.donor_sam.seq)
-        else:
-            return len(self.consensus)/2
+        if self._splice_ind is None:
+            if self.donor_sam.exists and self.acceptor_sam.exists:
+                #NOTE currently doesn't handle gaps well (just returns the donor side index of gap)
+                self._splice_ind = len(self.donor_sam.seq)
+            else:
+                self._splice_ind = len(self.consensus)//2
+        return self._splice_ind
 
 
     #Use the sam's again to find the size of the gap between the two pieces
@@ -82,9 +167,12 @@ class Junction(object):
             the distance between the 3' end of the donor and 5' end of the acceptor
             if one or both of the sam's are undefined return None
         """
-        if self.donor_sam.exists and self.acceptor_sam.exists:
+        if self._splice_gap is not None:
+            return self._splice_gap
+        elif self.donor_sam.exists and self.acceptor_sam.exists:
             #RB 5/26/17: Having strange index errors, I think going by lengths is equivalent
-            return len(self.consensus)-len(self.donor_sam.seq)-len(self.acceptor_sam.seq)
+            self._splice_gap = len(self.consensus)-len(self.donor_sam.seq)-len(self.acceptor_sam.seq)
+            return self._splice_gap
 
             #sys.stderr.write(self.consensus+':  '+self.donor_sam.seq+'\n')
             #donor_pos = self.consensus.index(self.donor_sam.seq)+len(self.donor_sam.seq)
@@ -128,17 +216,19 @@ class Junction(object):
             "Three_Only" if only the acceptor sam exists
             "None" if niether sam exists
         """
-        if self.donor_sam.exists and self.acceptor_sam.exists:
-            if self.splice_gap() == 0:
-                return "Full"
+        if self._splice_type is None:
+            if self.donor_sam.exists and self.acceptor_sam.exists:
+                if self.splice_gap() == 0:
+                    self._splice_type = "Full"
+                else:
+                    self._splice_type = "Gapped"
+            elif self.donor_sam.exists:
+                self._splice_type = "Five_Only"
+            elif self.acceptor_sam.exists:
+                self._splice_type = "Three_Only"
             else:
-                return "Gapped"
-        elif self.donor_sam.exists:
-            return "Five_Only"
-        elif self.acceptor_sam.exists:
-            return "Three_Only"
-        else:
-            return "None"
+                self._splice_type = "None"
+        return self._splice_type
 
 
     #Check to see if this jct represents a fusion
@@ -152,43 +242,55 @@ class Junction(object):
             bool of whether or not the donor and acceptor have different genes
             if one or more don't exists then return False
         """
+        #Only the default cutoff is cached since that is what the pipeline uses
+        if span_cutoff == 1e6 and self._fusion_type is not None:
+            return self._fusion_type
+
         anonat = "" #Can be 'bot', 'donor', 'acceptor', or 'none'
         chroms = "" #Can be 'interchrom', 'distant-intrachrom', or 'local-intrachrom'
         strand = "" #Can be 'inversion', 'plus', or 'minus'
         revreg = "" #Can be 'rev', 'reg', or 'invert'
         
         #Get the anonat type
-        if self.at_boundary("donor") and self.at_boundary("acceptor"):
+        don_at_boundary = self.at_donor_boundary()
+        acc_at_boundary = self.at_acceptor_boundary()
+        if don_at_boundary and acc_at_boundary:
             anonat = "both"
-        elif self.at_boundary("donor"):
+        elif don_at_boundary:
             anonat = "donor"
-        elif self.at_boundary("acceptor"):
+        elif acc_at_boundary:
             anonat = "acceptor"
         else:
             anonat = "niether"
 
-        #Get the chromosomes type
-        if self.donor_sam.chromosome != self.acceptor_sam.chromosome:
+        #Only look up the sams and their splice sites once
+        don_sam = self.donor_sam
+        acc_sam = self.acceptor_sam
+        don_pos = don_sam.donor()
+        acc_pos = acc_sam.acceptor()
+
+        #Get the chromosomes type (span inlined, it is -1 unless both sams exist)
+        if don_sam.chromosome != acc_sam.chromosome:
             chroms = "interchrom"
-        elif self.span() >= span_cutoff:
+        elif don_sam.exists and acc_sam.exists and abs(don_pos-acc_pos) >= span_cutoff:
             chroms = "distant-intrachrom"
         else:
             chroms = "local-intrachrom"
 
         #Get the strand type
-        if self.donor_sam.strand != self.acceptor_sam.strand:
+        if don_sam.strand != acc_sam.strand:
             strand = "inversion"
-        elif self.donor_sam.strand == "+":
+        elif don_sam.strand == "+":
             strand = "plus"
-        elif self.donor_sam.strand == "-":
+        elif don_sam.strand == "-":
             strand = "minus"
 
         #Get the revreg type
         if strand == "inversion":
             revreg = "invert"
-        elif self.donor_sam.donor() < self.acceptor_sam.acceptor() and self.donor_sam.strand == "+":
+        elif don_pos < acc_pos and don_sam.strand == "+":
             revreg = "reg"
-        elif self.donor_sam.donor() > self.acceptor_sam.acceptor() and self.donor_sam.strand == "-":
+        elif don_pos > acc_pos and don_sam.strand == "-":
             revreg = "reg"
         else:
             revreg = "rev"
@@ -197,12 +299,15 @@ class Junction(object):
         fusion = "no_fusion"
 
         if anonat == "both":
-            if self.splice_gap() != None and abs(self.splice_gap()) <= self.constants_dict["fusion_max_gap"]:
+            splice_gap = self.splice_gap()
+            if splice_gap != None and abs(splice_gap) <= self.constants_dict["fusion_max_gap"]:
                 if chroms != "local-intrachrom":
                     fusion = "fusion"
 
         #Concatenate them into one string
         fusion_type = fusion+"-"+anonat+"_"+chroms+"_"+strand+"_"+revreg
+        if span_cutoff == 1e6:
+            self._fusion_type = fusion_type
         return fusion_type
 
 
@@ -225,43 +330,72 @@ class Junction(object):
             explained above
         """
         #If donor distance is requested
-        if splice_site == "donor" and self.donor_sam.gtf:
-            donor_dist = 0
-            if not bowtie_style:
-                if self.donor_sam.strand == "+":
-                    donor_dist = self.donor_sam.donor()-self.donor_sam.gtf.donor
-                elif self.donor_sam.strand == "-":
-                    donor_dist = self.donor_sam.gtf.donor-self.donor_sam.donor()
-                else:
-                    sys.stderr.write("SPORK ERROR: in Junction boundary dist, incorrect strand option \n")
-                    sys.exit(1)
-            elif bowtie_style:
-                donor_dist = self.donor_sam.donor()-self.donor_sam.gtf.donor
-
-            return donor_dist
+        if splice_site == "donor":
+            sam,dist = self.donor_sam,self.donor_boundary_dist()
 
         #If acceptor distance is requested
-        elif splice_site == "acceptor" and self.acceptor_sam.gtf:
-            acceptor_dist = 0
-            if not bowtie_style:
-                if self.acceptor_sam.strand == "+":
-                    acceptor_dist = self.acceptor_sam.acceptor()-self.acceptor_sam.gtf.acceptor
-                elif self.acceptor_sam.strand == "-":
-                    acceptor_dist = self.acceptor_sam.gtf.acceptor-self.acceptor_sam.acceptor()
-                else:
-                    sys.stderr.write("SPORK ERROR: in Junction boundary dist, incorrect strand option \n")
-                    sys.exit(1)
-            elif bowtie_style:
-                acceptor_dist = self.acceptor_sam.acceptor()-self.acceptor_sam.gtf.acceptor
-                
-            return acceptor_dist
-
-        #If a different string was passed in or the specified gtf doesn't exist
+        elif splice_site == "acceptor":
+            sam,dist = self.acceptor_sam,self.acceptor_boundary_dist()
+
+        #If a different string was passed in
         else:
-            sys.stderr.write(str(self)+'\n')
-            sys.stderr.write("SPORK ERROR: in Junction boundary dist, incorrect str or gtf doesn't exist\n")
+            self._boundary_dist_error()
+
+        #The cached distance is bowtie style, only the strand aware style flips it on the - strand
+        if bowtie_style or sam.strand == "+":
+            return dist
+        elif sam.strand == "-":
+            return -dist
+        else:
+            sys.stderr.write("SPORK ERROR: in Junction boundary dist, incorrect strand option \n")
             sys.exit(1)
 
+    #Bowtie style boundary_dist("donor") without the splice_site dispatch
+    def donor_boundary_dist(self):
+        """
+        Goal: get the bowtie style distance of the donor from its closest gtf
+        Arguments:
+            none
+
+        Returns:
+            the same value as boundary_dist("donor"), cached after the first call
+        """
+        if self._don_dist is None:
+            if not self.donor_sam.gtf:
+                self._boundary_dist_error()
+            self._don_dist = self.donor_sam.donor()-self.donor_sam.gtf.donor
+        return self._don_dist
+
+    #Bowtie style boundary_dist("acceptor") without the splice_site dispatch
+    def acceptor_boundary_dist(self):
+        """
+        Goal: get the bowtie style distance of the acceptor from its closest gtf
+        Arguments:
+            none
+
+        Returns:
+            the same value as boundary_dist("acceptor"), cached after the first call
+        """
+        if self._acc_dist is None:
+            if not self.acceptor_sam.gtf:
+                self._boundary_dist_error()
+            self._acc_dist = self.acceptor_sam.acceptor()-self.acceptor_sam.gtf.acceptor
+        return self._acc_dist
+
+    #Shared exit for a bad splice_site string or a missing gtf
+    def _boundary_dist_error(self):
+        """
+        Goal: report a boundary distance that can't be computed and exit
+        Arguments:
+            none
+
+        Returns:
+            nothing (exits)
+        """
+        sys.stderr.write(str(self)+'\n')
+        sys.stderr.write("SPORK ERROR: in Junction boundary dist, incorrect str or gtf doesn't exist\n")
+        sys.exit(1)
+
     #Return whether or not an donor and acceptor is at a boundary
     def at_boundary(self,splice_site):
         """
@@ -277,11 +411,36 @@ class Junction(object):
             a boolean of whether or not the specified sam is within
             'radius' distance of any exon boundary
         """
-        dist = self.boundary_dist(splice_site)
-        if abs(dist) <= self.constants_dict["at_boundary_cutoff"]:
-            return True
+        if splice_site == "donor":
+            return self.at_donor_boundary()
+        elif splice_site == "acceptor":
+            return self.at_acceptor_boundary()
         else:
-            return False
+            self._boundary_dist_error()
+
+    #at_boundary("donor") without the splice_site dispatch
+    def at_donor_boundary(self):
+        """
+        Goal: check to see if the donor sam is at an exon boundary
+        Arguments:
+            none
+
+        Returns:
+            the same boolean as at_boundary("donor")
+        """
+        return abs(self.donor_boundary_dist()) <= self.constants_dict["at_boundary_cutoff"]
+
+    #at_boundary("acceptor") without the splice_site dispatch
+    def at_acceptor_boundary(self):
+        """
+        Goal: check to see if the acceptor sam is at an exon boundary
+        Arguments:
+            none
+
+        Returns:
+            the same boolean as at_boundary("acceptor")
+        """
+        return abs(self.acceptor_boundary_dist()) <= self.constants_dict["at_boundary_cutoff"]
 
     #Returns whether or not this junction is linear
     def linear(self):
@@ -293,12 +452,7 @@ class Junction(object):
         Returns:
             a boolean of whether the junction is linear or not
         """
-        five_prime_bin,three_prime_bin,strand_info = self.bin_pair.split("_")
-        five_prime_chr = five_prime_bin.split(":")[0]
-        five_prime_bin = five_prime_bin.split(":")[1]
-        three_prime_chr = three_prime_bin.split(":")[0]
-        three_prime_bin = three_prime_bin.split(":")[1]
-        linear = True if int(five_prime_bin) <= int(three_prime_bin) else False
+        linear = self._five_bin <= self._three_bin
         #RB 04/25/17: I'm not sure this is correct, took_reverse_compliment is always False
         linear = not linear if self.took_reverse_compliment else linear
         return linear
@@ -321,14 +475,10 @@ class Junction(object):
         #sys.stdout.write("After copy in yield_forward_and_reverse\n")
         rev_self.took_reverse_compliment = not rev_self.took_reverse_compliment
 
-        comp = {"A":"T","a":"t","T":"A","t":"a",
-                "G":"C","g":"c","C":"G","c":"g",
-                "N":"N","n":"n"}
-
         #Take the reverse compliments of the seqs and switch them between donor and acceptor
-        rev_self.consensus = "".join([comp[base] for base in self.consensus])[::-1]
-        rev_self.donor_sam.seq = "".join([comp[base] for base in self.donor_sam.seq])[::-1]
-        rev_self.acceptor_sam.seq = "".join([comp[base] for base in self.acceptor_sam.seq])[::-1]
+        rev_self.consensus = self.consensus.translate(_COMP_TABLE)[::-1]
+        rev_self.donor_sam.seq = self.donor_sam.seq.translate(_COMP_TABLE)[::-1]
+        rev_self.acceptor_sam.seq = self.acceptor_sam.seq.translate(_COMP_TABLE)[::-1]
         rev_self.donor_sam.seq,rev_self.acceptor_sam.seq = rev_self.acceptor_sam.seq,rev_self.donor_sam.seq
         
         #Flip the strands of both SAMs
@@ -362,14 +512,10 @@ class Junction(object):
         """
         self.took_reverse_compliment = not self.took_reverse_compliment
 
-        comp = {"A":"T","a":"t","T":"A","t":"a",
-                "G":"C","g":"c","C":"G","c":"g",
-                "N":"N","n":"n"}
-
         #Take the reverse compliments of the seqs and switch them between donor and acceptor
-        self.consensus = "".join([comp[base] for base in self.consensus])[::-1]
-        self.donor_sam.seq = "".join([comp[base] for base in self.donor_sam.seq])[::-1]
-        self.acceptor_sam.seq = "".join([comp[base] for base in self.acceptor_sam.seq])[::-1]
+        self.consensus = self.consensus.translate(_COMP_TABLE)[::-1]
+        self.donor_sam.seq = self.donor_sam.seq.translate(_COMP_TABLE)[::-1]
+        self.acceptor_sam.seq = self.acceptor_sam.seq.translate(_COMP_TABLE)[::-1]
         self.donor_sam.seq,self.acceptor_sam.seq = self.acceptor_sam.seq,self.donor_sam.seq
         
         #Flip the strands of both SAMs
@@ -383,6 +529,7 @@ class Junction(object):
         self.donor_sam.start,self.acceptor_sam.start = self.acceptor_sam.start,self.donor_sam.start
         self.donor_sam.stop,self.acceptor_sam.stop = self.acceptor_sam.stop,self.donor_sam.stop
         self.donor_sam.chromosome,self.acceptor_sam.chromosome = self.acceptor_sam.chromosome,self.donor_sam.chromosome
+        self.invalidate()
 
         return self
 
@@ -398,36 +545,36 @@ class Junction(object):
             a fasta formatted string (with a newline between header and sequence)
         """
         #Make the necessary variables
-        chrom1 = self.donor_sam.chromosome
-        chrom2 = self.acceptor_sam.chromosome
-        genes1 = self.donor_sam.str_gene()
-        genes2 = self.acceptor_sam.str_gene()
-        pos1 = self.donor_sam.donor()
-        pos2 = self.acceptor_sam.acceptor()
-        strand1 = self.donor_sam.strand
-        strand2 = self.acceptor_sam.strand
+        don_sam = self.donor_sam
+        acc_sam = self.acceptor_sam
+        chrom1 = don_sam.chromosome
+        chrom2 = acc_sam.chromosome
+        genes1 = don_sam.str_gene()
+        genes2 = acc_sam.str_gene()
+        pos1 = don_sam.donor()
+        pos2 = acc_sam.acceptor()
+        strand1 = don_sam.strand
+        strand2 = acc_sam.strand
         fusion_type = self.get_fusion_type()
 
-        #Start building the fasta string
-        fasta_str = ""
-        fasta_str += ">"
-        fasta_str += str(chrom1)+":"+str(genes1)+":"+str(pos1)+":"+str(strand1)+"|"
-        fasta_str += str(chrom2)+":"+str(genes2)+":"+str(pos2)+":"+str(strand2)+"|"
-        fasta_str += fusion_type
-        fasta_str += ",num="+str(len(self.bin_pair_group))
-        fasta_str += ",score="+str(self.score)
-        fasta_str += ",gap="+str(self.splice_gap())
-        fasta_str += ",don-dist:"+str(self.boundary_dist("donor"))
-        fasta_str += ",acc-dist:"+str(self.boundary_dist("acceptor"))
-        fasta_str += ",mapq="+str(self.mapq)
-        fasta_str += ",badfj3:"+str(self.badfj3)
-        fasta_str += ",jct_ind="+str(self.jct_ind)
-        fasta_str += "\n"
-
-        #Add the actual padded consensus to the output string
-        splice_flank_len = int(self.constants_dict["splice_flank_len"])
-        full_consensus = self.format_consensus(splice_flank_len)
-        fasta_str += str(full_consensus)+"\n"
+        #Get the actual padded consensus for the output string
+        full_consensus = self._padded_consensus()
+
+        #Build the fasta string in one join
+        fasta_str = "".join([
+            ">",
+            str(chrom1),":",str(genes1),":",str(pos1),":",str(strand1),"|",
+            str(chrom2),":",str(genes2),":",str(pos2),":",str(strand2),"|",
+            fusion_type,
+            ",num=",str(len(self.bin_pair_group)),
+            ",score=",str(self.score),
+            ",gap=",str(self.splice_gap()),
+            ",don-dist:",str(self.donor_boundary_dist()),
+            ",acc-dist:",str(self.acceptor_boundary_dist()),
+            ",mapq=",str(self.mapq),
+            ",badfj3:",str(self.badfj3),
+            ",jct_ind=",str(self.jct_ind),"\n",
+            str(full_consensus),"\n"])
 
         return fasta_str
 
@@ -443,39 +590,45 @@ class Junction(object):
         Returns:
             a description of the junction over multiple lines
         """
-        fasta_str = ""
-        fasta_str += ">|"+str(self.donor_sam.chromosome)+"|"
-        fasta_str += str(self.donor_sam.str_gene())+" "
-        fasta_str += str(self.donor_sam.gene_strand())+" strand|"
-        fasta_str += str(self.donor_sam.start)+"-"
-        fasta_str += str(self.donor_sam.stop)+"|"
-        fasta_str += "strand1:"+str(self.donor_sam.strand)+"|"
-        fasta_str += "boundary_dist1:"+str(self.boundary_dist("donor"))+"|"
-        fasta_str += "at_boundary1:"+str(self.at_boundary("donor"))+"|\n"
-
-        fasta_str += ">|"+str(self.acceptor_sam.chromosome)+"|"
-        fasta_str += str(self.acceptor_sam.str_gene())+" "
-        fasta_str += str(self.acceptor_sam.gene_strand())+" strand|"
-        fasta_str += str(self.acceptor_sam.start)+"-"
-        fasta_str += str(self.acceptor_sam.stop)+"|"
-        fasta_str += "strand2:"+str(self.acceptor_sam.strand)+"|"
-        fasta_str += "boundary_dist2:"+str(self.boundary_dist("acceptor"))+"|"
-        fasta_str += "at_boundary2:"+str(self.at_boundary("acceptor"))+"|\n"
-
-        fasta_str += ">|splice:"+str(self.splice_ind())+"|"
-        fasta_str += "score:"+str(self.score)+"|"
-        fasta_str += "fusion:"+str(self.get_fusion_type())+"|"
-        fasta_str += "num:"+str(len(self.bin_pair_group))+"|"
-        fasta_str += "splice:"+str(self.splice_type())+"|"
-        fasta_str += "mapq="+str(self.mapq)+"|"
-        fasta_str += "badfj3:"+str(self.badfj3)+"|"
-        fasta_str += "jct_ind:"+str(self.jct_ind)+"|\n"
-
-        splice_flank_len = int(self.constants_dict["splice_flank_len"])
-        full_consensus = self.format_consensus(splice_flank_len)
-        fasta_str += str(full_consensus)+"\n"
-        fasta_str += str(self.donor_sam.seq)+"\n"
-        fasta_str += " "*self.splice_ind()+str(self.acceptor_sam.seq)+"\n"
+        #Only look up the sams and their genes once
+        don_sam = self.donor_sam
+        acc_sam = self.acceptor_sam
+        don_genes = don_sam.str_gene()
+        acc_genes = acc_sam.str_gene()
+
+        full_consensus = self._padded_consensus()
+
+        fasta_str = "".join([
+            ">|",str(don_sam.chromosome),"|",
+            str(don_genes)," ",
+            str(don_sam.gene_strand())," strand|",
+            str(don_sam.start),"-",
+            str(don_sam.stop),"|",
+            "strand1:",str(don_sam.strand),"|",
+            "boundary_dist1:",str(self.donor_boundary_dist()),"|",
+            "at_boundary1:",str(self.at_donor_boundary()),"|\n",
+
+            ">|",str(acc_sam.chromosome),"|",
+            str(acc_genes)," ",
+            str(acc_sam.gene_strand())," strand|",
+            str(acc_sam.start),"-",
+            str(acc_sam.stop),"|",
+            "strand2:",str(acc_sam.strand),"|",
+            "boundary_dist2:",str(self.acceptor_boundary_dist()),"|",
+            "at_boundary2:",str(self.at_acceptor_boundary()),"|\n",
+
+            ">|splice:",str(self.splice_ind()),"|",
+            "score:",str(self.score),"|",
+            "fusion:",str(self.get_fusion_type()),"|",
+            "num:",str(len(self.bin_pair_group)),"|",
+            "splice:",str(self.splice_type()),"|",
+            "mapq=",str(self.mapq),"|",
+            "badfj3:",str(self.badfj3),"|",
+            "jct_ind:",str(self.jct_ind),"|\n",
+
+            str(full_consensus),"\n",
+            str(don_sam.seq),"\n",
+            " "*self.splice_ind(),str(acc_sam.seq),"\n"])
 
         #Also printing out gtf information
         #fasta_str += "Donor_gtf:"+str(self.donor_sam.gtf)+"\n"
@@ -493,38 +646,44 @@ class Junction(object):
         Returns:
             a fasta string (with a newline between the header and sequence)
         """
-        fasta_str = ""
-        fasta_str += ">|chromosome1:"+str(self.donor_sam.chromosome)+"|"
-        fasta_str += "genes1:"+str(self.donor_sam.str_gene())+"|"
-        fasta_str += "start1:"+str(self.donor_sam.start)+"|"
-        fasta_str += "stop1:"+str(self.donor_sam.stop)+"|"
-        fasta_str += "strand1:"+str(self.donor_sam.strand)+"|"
-        fasta_str += "boundary_dist1:"+str(self.boundary_dist("donor"))+"|"
-        fasta_str += "at_boundary1:"+str(self.at_boundary("donor"))+"|_"
-
-        fasta_str += "|chromosome2:"+str(self.acceptor_sam.chromosome)+"|"
-        fasta_str += "genes2:"+str(self.acceptor_sam.str_gene())+"|"
-        fasta_str += "start2:"+str(self.acceptor_sam.start)+"|"
-        fasta_str += "stop2:"+str(self.acceptor_sam.stop)+"|"
-        fasta_str += "strand2:"+str(self.acceptor_sam.strand)+"|"
-        fasta_str += "boundary_dist2:"+str(self.boundary_dist("acceptor"))+"|"
-        fasta_str += "at_boundary2:"+str(self.at_boundary("acceptor"))+"|_|"
-
-        fasta_str += "jct_ind:"+str(self.jct_ind)+"|"
-        fasta_str += "splice:"+str(self.splice_ind())+"|"
-        fasta_str += "span:"+str(self.span())+"|"
-        fasta_str += "score:"+str(self.score)+"|"
-        fasta_str += "fusion:"+str(self.get_fusion_type())+"|"
-        fasta_str += "num:"+str(len(self.bin_pair_group))+"|"
-        fasta_str += "splice-gap:"+str(self.splice_gap())+"|"
-        fasta_str += "splice-type:"+str(self.splice_type())+"|"
-        fasta_str += "badfj3:"+str(self.badfj3)+"|"
-        fasta_str += "took-rev-comp:"+str(self.took_reverse_compliment)+"|\n"
+        #Only look up the sams and their genes once
+        don_sam = self.donor_sam
+        acc_sam = self.acceptor_sam
+        don_genes = don_sam.str_gene()
+        acc_genes = acc_sam.str_gene()
 
         # Add N padding to the consensus to get a uniform len
-        splice_flank_len = int(self.constants_dict["splice_flank_len"])
-        full_consensus = self.format_consensus(splice_flank_len)
-        fasta_str += str(full_consensus)+"\n"
+        full_consensus = self._padded_consensus()
+
+        fasta_str = "".join([
+            ">|chromosome1:",str(don_sam.chromosome),"|",
+            "genes1:",str(don_genes),"|",
+            "start1:",str(don_sam.start),"|",
+            "stop1:",str(don_sam.stop),"|",
+            "strand1:",str(don_sam.strand),"|",
+            "boundary_dist1:",str(self.donor_boundary_dist()),"|",
+            "at_boundary1:",str(self.at_donor_boundary()),"|_",
+
+            "|chromosome2:",str(acc_sam.chromosome),"|",
+            "genes2:",str(acc_genes),"|",
+            "start2:",str(acc_sam.start),"|",
+            "stop2:",str(acc_sam.stop),"|",
+            "strand2:",str(acc_sam.strand),"|",
+            "boundary_dist2:",str(self.acceptor_boundary_dist()),"|",
+            "at_boundary2:",str(self.at_acceptor_boundary()),"|_|",
+
+            "jct_ind:",str(self.jct_ind),"|",
+            "splice:",str(self.splice_ind()),"|",
+            "span:",str(self.span()),"|",
+            "score:",str(self.score),"|",
+            "fusion:",str(self.get_fusion_type()),"|",
+            "num:",str(len(self.bin_pair_group)),"|",
+            "splice-gap:",str(self.splice_gap()),"|",
+            "splice-type:",str(self.splice_type()),"|",
+            "badfj3:",str(self.badfj3),"|",
+            "took-rev-comp:",str(self.took_reverse_compliment),"|\n",
+
+            str(full_consensus),"\n"])
         return fasta_str
 
     
@@ -537,17 +696,29 @@ class Junction(object):
             splice_flank_len is an int deciding how long either side should be
             from the consensus
         Returns:
-            a string of either the full consensus of None if there is no splice ind
-        """
-        full_consensus = None
-        if self.splice_ind() != -1:
-            splice_flank_len = int(self.constants_dict["splice_flank_len"])
-            left_padding = "N"*(splice_flank_len-self.splice_ind())
-            right_padding = "N"*(splice_flank_len-(len(self.consensus)-self.splice_ind()))
-            five_consensus = self.consensus[:self.splice_ind()]
-            three_consensus = self.consensus[self.splice_ind():]
-            full_consensus = left_padding+five_consensus+three_consensus+right_padding
-        return str(full_consensus)
+            a string of the full padded consensus
+            (splice_ind always gives a splice site, falling back on the middle of the consensus)
+        """
+        splice_ind = self.splice_ind()
+        left_padding = _n_padding(splice_flank_len-splice_ind)
+        right_padding = _n_padding(splice_flank_len-(len(self.consensus)-splice_ind))
+        full_consensus = left_padding+self.consensus+right_padding
+        return full_consensus
+
+
+    #Padded consensus shared by all of the output formats
+    def _padded_consensus(self):
+        """
+        Goal: return format_consensus() using splice_flank_len from the constants dict (parsed in __init__)
+              computed once and reused by every output format of this junction
+        Arguments:
+            none
+        Returns:
+            the padded consensus string
+        """
+        if self._padded is None:
+            self._padded = self.format_consensus(self._flank)
+        return self._padded
    
 
     #Give back the R1 readIDs used to make this junction
@@ -581,22 +752,28 @@ class Junction(object):
         Returns:
             the string to be printed out
         """
-        out_str = ""
-        out_str += "Junction with bin pair ["+self.bin_pair+"] with ["+str(len(self.bin_pair_group))+"] reads mapped\n"
-        out_str += "Linear " if self.linear() else "Non-Linear "
-        out_str += "Donor on the "+str(self.donor_sam.strand)+" strand and acceptor on the "+str(self.acceptor_sam.strand)+"\n"
-        out_str += "5' map position ["+str(self.donor_sam.start)+"-"+str(self.donor_sam.stop)+"]\n"
-        out_str += "3' map position ["+str(self.acceptor_sam.start)+"-"+str(self.acceptor_sam.stop)+"]\n"
-        out_str += "badfj3:"+str(self.badfj3)+"\n"
-        out_str += "Consensus with score ["+str(self.score)+"] and donor splice site ["+str(self.donor_sam.stop)+"]:\n"
-        out_str += str(self.consensus)+"\n"
-        out_str += str(self.donor_sam.seq)+"\n"
-        out_str += " "*len(str(self.donor_sam.seq))+str(self.acceptor_sam.seq)+"\n"
-        out_str += "Donor genes ["+str(self.donor_sam.str_gene())+"]\n"
-        out_str += "Acceptor genes ["+str(self.acceptor_sam.str_gene())+"]\n"
+        #Only look up the sams and their genes once
+        don_sam = self.donor_sam
+        acc_sam = self.acceptor_sam
+        don_genes = don_sam.str_gene()
+        acc_genes = acc_sam.str_gene()
+        out_str = "".join([
+            "Junction with bin pair [",self.bin_pair,"] with [",str(len(self.bin_pair_group)),"] reads mapped\n",
+            "Linear " if self.linear() else "Non-Linear ",
+            "Donor on the ",str(don_sam.strand)," strand and acceptor on the ",str(acc_sam.strand),"\n",
+            "5' map position [",str(don_sam.start),"-",str(don_sam.stop),"]\n",
+            "3' map position [",str(acc_sam.start),"-",str(acc_sam.stop),"]\n",
+            "badfj3:",str(self.badfj3),"\n",
+            "Consensus with score [",str(self.score),"] and donor splice site [",str(don_sam.stop),"]:\n",
+            str(self.consensus),"\n",
+            str(don_sam.seq),"\n",
+            " "*len(str(don_sam.seq)),str(acc_sam.seq),"\n",
+            "Donor genes [",str(don_genes),"]\n",
+            "Acceptor genes [",str(acc_genes),"]\n"])
         return out_str
 
     #Rank junctions in order of bin_pairs when sorted
+    #NOTE prefer sorting with key=SORT_KEY, this is kept for plain sorted() calls
     def __lt__(self,other):
         """
         Goal: give a comparison operator for the Junction class
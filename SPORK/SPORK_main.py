@@ -14,6 +14,7 @@
 ###################
 # General Imports #
 ###################
+from operator import attrgetter
 import subprocess
 import argparse
 import pickle
@@ -399,7 +400,8 @@ for file_name in file_names:
         id_to_sam_dict = {} #clearing the dictionary to free up space
 
         # Sort the bin_pairs by bin_pair id to form list w/ groups adjacent
-        bin_pairs.sort()
+        # (same order as BinPair.__lt__, but the key compare stays in C)
+        bin_pairs.sort(key=attrgetter("bin_pair"))
 
         # Save the bin_pairs to a file to see how they look
         bin_pair_out_file_name = os.path.join(output_dir,"bin_pairs.txt")
@@ -522,9 +524,7 @@ for file_name in file_names:
         start_write_pre_collapsed = time.time()
         machete_style_name = os.path.join(output_dir,"pre_collapse_novel_junctions_machete.fasta")
         machete_style_file = open(machete_style_name, "w")
-        for denovo_junction in denovo_junctions:
-            jct_ind = denovo_junctions.index(denovo_junction)
-            machete_style_file.write(denovo_junction.fasta_MACHETE())
+        write_junctions(denovo_junctions,machete_style_file,"machete")
         machete_style_file.close()
         write_time("-Time to write pre-collapse junctions ",start_write_pre_collapsed,timer_file_path)
  
@@ -564,13 +564,13 @@ for file_name in file_names:
         log_style_file = open(log_style_name, "w")
         fusions_file = open(fusions_file_name, "w")
 
-        # Loop through the denovo junctions writing them where necessary
-        for denovo_junction in denovo_junctions:
-            #NOTE change back to verbose_fasta_string()
-            junction_fasta.write(denovo_junction.fasta_MACHETE())
-            log_style_file.write(denovo_junction.log_string())
-            if denovo_junction in fusion_junctions:
-                fusions_file.write(denovo_junction.fasta_MACHETE())
+        # Write the denovo junctions to each file in batches
+        # (set lookup so the fusion check isn't a scan of fusion_junctions)
+        #NOTE change back to "verbose" (verbose_fasta_string)
+        fusion_junction_set = set(fusion_junctions)
+        write_junctions(denovo_junctions,junction_fasta,"machete")
+        write_junctions(denovo_junctions,log_style_file,"log")
+        write_junctions([jct for jct in denovo_junctions if jct in fusion_junction_set],fusions_file,"machete")
 
         # Close the three output files
         junction_fasta.close()
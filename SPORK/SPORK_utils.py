@@ -10,7 +10,7 @@ import re
 
 # Specific Imports
 from SPORK_consensus_utils import *
-from SPORK_Junction import Junction
+from SPORK_Junction import Junction,_COMP_TABLE
 from SPORK_BinPair import BinPair
 from SPORK_GTFEntry import GTFEntry
 from SPORK_SAMEntry import SAMEntry
@@ -360,6 +360,7 @@ def find_splice_inds_v2(denovo_junctions,constants_dict):
         jct.consensus = best_don.seq+best_acc.seq
         jct.donor_sam = best_don
         jct.acceptor_sam = best_acc
+        jct.finalize()
         jcts_with_splice.append(jct)
 
     #Return the jcts
@@ -609,6 +610,7 @@ def find_splice_inds(denovo_junctions,constants_dict):
                 acceptor_sam.seq = reverse_compliment(acceptor_sam.seq)+down_remaining
                 acceptor_sam.start -= len(down_remaining)
             jct.acceptor_sam = acceptor_sam
+            jct.finalize()
  
             jcts_with_splice.append(jct)
 
@@ -983,6 +985,9 @@ def get_jct_gtf_info(junctions,gtfs,constants_dict):
             sys.stdout.write('Acc gtf:'+str(gtf)+'\n')
             sys.stdout.write('Junction:'+str(junction)+'\n')
             sys.stdout.write('----\n')
+
+        #The gtfs change the boundary and fusion results
+        junction.invalidate()
            
 
 #################################
@@ -1253,6 +1258,44 @@ def write_glm_class_file(class_file_name,sam_list):
             class_file.write(out_line)
 
 
+#######################
+#   Write Junctions   #
+#######################
+# Writes junctions out in large chunks instead of one write call per junction
+def write_junctions(junctions,out_file,out_format="machete",buffer_size=1<<20):
+    """
+    Goal: write out the formatted junctions in batches
+    Arguments:
+        junctions is an iterable of Junction
+        out_file is an already opened file to write to
+        out_format is a string for which Junction output to use:
+            "machete" (fasta_MACHETE), "log" (log_string) or "verbose" (verbose_fasta_string)
+        buffer_size is roughly how many characters to hold before each write (default 1MB)
+
+    Returns:
+        nothing (just writes to out_file)
+    """
+    formatters = {"machete":Junction.fasta_MACHETE,
+                  "log":Junction.log_string,
+                  "verbose":Junction.verbose_fasta_string}
+    if out_format not in formatters:
+        sys.stderr.write("SPORK ERROR: in write_junctions, unknown out_format ["+str(out_format)+"]\n")
+        sys.exit(1)
+    format_jct = formatters[out_format]
+
+    buf = []
+    buf_len = 0
+    for jct in junctions:
+        jct_str = format_jct(jct)
+        buf.append(jct_str)
+        buf_len += len(jct_str)
+        if buf_len >= buffer_size:
+            out_file.write("".join(buf))
+            buf = []
+            buf_len = 0
+    out_file.write("".join(buf))
+
+
 ##################
 #   Write Time   #
 ##################
@@ -1536,18 +1579,7 @@ def reverse_compliment(seq):
     Returns:
         the reverse compliment string
     """
-    comp_dict = {"A":"T",
-                 "a":"t",
-                 "T":"A",
-                 "t":"a",
-                 "C":"G",
-                 "c":"g",
-                 "G":"C",
-                 "g":"c",
-                 "N":"N",
-                 "n":"n"}
-
-    rev_comp_seq = "".join([comp_dict[base] for base in seq])[::-1]
+    rev_comp_seq = seq.translate(_COMP_TABLE)[::-1]
     return rev_comp_seq
 
 